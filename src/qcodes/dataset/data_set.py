@@ -201,6 +201,9 @@ class DataSet(BaseDataSet):
         "captured_counter",
     )
     background_sleep_time = 1e-3
+    # maximal number of buffered results handed to add_results at once
+    # when flushing, this bounds the size of the intermediate value lists
+    flush_chunk_size = 10_000
 
     def __init__(
         self,
@@ -1229,7 +1232,7 @@ class DataSet(BaseDataSet):
         self._raise_if_not_writable()
         interdeps = self._rundescriber.interdeps
 
-        toplevel_params = set(interdeps.dependencies).intersection(set(result_dict))
+        toplevel_params = interdeps.dependencies.keys() & result_dict.keys()
 
         new_results: dict[str, dict[str, numpy.ndarray]] = {}
 
@@ -1262,15 +1265,15 @@ class DataSet(BaseDataSet):
                     ps.name: result_dict[ps] for ps in all_params
                 }
                 res_list = [res_dict]
-            self._results += res_list
+            self._results.extend(res_list)
 
         # Finally, handle standalone parameters
 
-        standalones = set(interdeps.standalones).intersection(set(result_dict))
+        standalones = interdeps.standalones.intersection(result_dict)
 
         if standalones:
             stdln_dict = {st: result_dict[st] for st in standalones}
-            self._results += self._finalize_res_dict_standalones(stdln_dict)
+            self._results.extend(self._finalize_res_dict_standalones(stdln_dict))
             if self._in_memory_cache:
                 for st in standalones:
                     new_results[st.name] = {
@@ -1299,10 +1302,8 @@ class DataSet(BaseDataSet):
             elif paramtype == "complex":
                 return complex(val)
             elif paramtype == "array":
-                if val.shape:
-                    return val
-                else:
-                    return numpy.reshape(val, (1,))
+                # 0D arrays are stored as arrays of a single element
+                return val if val.ndim else val.reshape(1)
             else:
                 raise ValueError(
                     f"Cannot handle unknown paramtype {paramtype!r} of {ps!r}."
@@ -1343,23 +1344,17 @@ class DataSet(BaseDataSet):
             toplevel_val = result_dict[toplevel_param]
             flat_results[toplevel_param.name] = toplevel_val.ravel()
             N = len(flat_results[toplevel_param.name])
-            for dep in deps_params:
-                if result_dict[dep].shape == ():
-                    flat_results[dep.name] = numpy.repeat(result_dict[dep], N)
-                else:
-                    flat_results[dep.name] = result_dict[dep].ravel()
-            for inff in inff_params:
-                if numpy.shape(result_dict[inff]) == ():
-                    flat_results[inff.name] = numpy.repeat(result_dict[inff], N)
+            for param in deps_params | inff_params:
+                value = result_dict[param]
+                if value.shape == ():
+                    flat_results[param.name] = numpy.full(N, value)
                 else:
-                    flat_results[inff.name] = result_dict[inff].ravel()
+                    flat_results[param.name] = value.ravel()
 
-            # And then put everything into the list
+            # And then put everything into the list, one row at a time
 
-            res_list = [
-                {p.name: flat_results[p.name][ind] for p in all_params}
-                for ind in range(N)
-            ]
+            names = tuple(flat_results)
+            res_list = [dict(zip(names, row)) for row in zip(*flat_results.values())]
 
         return res_list
 
@@ -1413,14 +1408,20 @@ class DataSet(BaseDataSet):
         log.debug("Flushing to database")
         writer_status = self._writer_status
         if len(self._results) > 0:
+            chunk_size = self.flush_chunk_size
+            n_written = 0
             try:
-                self.add_results(self._results)
+                while n_written < len(self._results):
+                    self.add_results(self._results[n_written : n_written + chunk_size])
+                    n_written += chunk_size
                 if writer_status.write_in_background:
                     log.debug("Successfully enqueued result for write thread")
                 else:
                     log.debug("Successfully wrote result to disk")
                 self._results = []
             except Exception as e:
+                # only keep the results that have not been written yet
+                del self._results[:n_written]
                 if writer_status.write_in_background:
                     log.warning(f"Could not enqueue result; {e}")
                 else:
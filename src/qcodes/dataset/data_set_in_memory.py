@@ -652,7 +652,7 @@ class DataSetInMem(BaseDataSet):
         self._raise_if_not_writable()
         interdeps = self._rundescriber.interdeps
 
-        toplevel_params = set(interdeps.dependencies).intersection(set(result_dict))
+        toplevel_params = interdeps.dependencies.keys() & result_dict.keys()
         new_results: dict[str, dict[str, np.ndarray]] = {}
         for toplevel_param in toplevel_params:
             inff_params = set(interdeps.inferences.get(toplevel_param, ()))
@@ -673,7 +673,7 @@ class DataSetInMem(BaseDataSet):
 
         # Finally, handle standalone parameters
 
-        standalones = set(interdeps.standalones).intersection(set(result_dict))
+        standalones = interdeps.standalones.intersection(result_dict)
 
         if standalones:
             for st in standalones:
@@ -11,9 +11,16 @@ import io
 import logging
 import traceback as tb_module
 import warnings
-from collections.abc import Callable, Mapping, MutableMapping, MutableSequence, Sequence
+from collections.abc import (
+    Callable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
 from contextlib import ExitStack
-from copy import deepcopy
+from copy import copy
 from inspect import signature
 from numbers import Number
 from time import perf_counter
@@ -68,6 +75,14 @@ SubscriberType = tuple[
     Callable[..., Any], MutableSequence[Any] | MutableMapping[Any, Any]
 ]
 
+# numpy dtype kinds that may be stored for each paramtype
+_ALLOWED_DTYPE_KINDS: dict[str, frozenset[str]] = {
+    "numeric": frozenset("iuf"),
+    "text": frozenset("SU"),
+    "array": frozenset("iufcSUmM"),
+    "complex": frozenset("c"),
+}
+
 
 class ParameterTypeError(Exception):
     pass
@@ -115,6 +130,15 @@ class DataSaver:
                 self._dataset.subscribe_from_config(subscriber)
 
         self._interdeps = interdeps
+        # maps parameter names and (once seen) parameter objects to their
+        # ParamSpecBase so that add_result does not have to recompute names.
+        # The parameter objects are dropped again when the run exits
+        self._spec_cache: dict[str | ParameterBase, ParamSpecBase] = {
+            name: paramspec for name, paramspec in interdeps._id_to_paramspec.items()
+        }
+        self._setpoint_spec_cache: dict[
+            tuple[str, tuple[str, ...] | None, int], tuple[ParamSpecBase, ...]
+        ] = {}
         self.write_period = float(write_period)
         # self._results will be filled by add_result
         self._results: list[dict[str, VALUE]] = []
@@ -254,6 +278,32 @@ class DataSaver:
                 local_results.update(self._unpack_partial_result(res))
         return local_results
 
+    def _paramspec_for(self, param: str | ParameterBase) -> ParamSpecBase:
+        """
+        Look up the ParamSpecBase registered for a parameter or parameter
+        name. Parameter objects are memoized by identity so that their
+        register name only has to be computed once. Raises a KeyError
+        if no such parameter is registered.
+        """
+        paramspec = self._spec_cache.get(param)
+        if paramspec is None:
+            paramspec = self._spec_cache[str_or_register_name(param)]
+            self._spec_cache[param] = paramspec
+        return paramspec
+
+    def _clear_spec_caches(self) -> None:
+        """
+        Drop the parameter objects memoized during the run so that the
+        DataSaver does not keep parameters and their instruments alive
+        once the run has ended.
+        """
+        self._spec_cache = {
+            name: paramspec
+            for name, paramspec in self._spec_cache.items()
+            if isinstance(name, str)
+        }
+        self._setpoint_spec_cache.clear()
+
     def _unpack_partial_result(
         self, partial_result: res_type
     ) -> dict[ParamSpecBase, np.ndarray]:
@@ -264,7 +314,7 @@ class DataSaver:
         """
         param, values = partial_result
         try:
-            parameter = self._interdeps._id_to_paramspec[str_or_register_name(param)]
+            parameter = self._paramspec_for(param)
         except KeyError:
             if str_or_register_name(param) == str(param):
                 err_msg = (
@@ -299,7 +349,7 @@ class DataSaver:
                 f"without setpoints. Cannot handle this."
             )
         try:
-            main_parameter = self._interdeps._id_to_paramspec[str(array_param)]
+            main_parameter = self._paramspec_for(array_param)
         except KeyError:
             raise ValueError(
                 "Can not add result for parameter "
@@ -347,7 +397,7 @@ class DataSaver:
             shape = parameter.shapes[i]
 
             try:
-                paramspec = self._interdeps._id_to_paramspec[parameter.full_names[i]]
+                paramspec = self._paramspec_for(parameter.full_names[i])
             except KeyError:
                 raise ValueError(
                     "Can not add result for parameter "
@@ -379,42 +429,73 @@ class DataSaver:
 
         return result_dict
 
-    def _unpack_setpoints_from_parameter(
+    def _setpoint_paramspecs(
         self,
         parameter: ParameterBase,
-        setpoints: Sequence[Any],
+        n_setpoints: int,
         sp_names: Sequence[str] | None,
         fallback_sp_name: str,
-    ) -> dict[ParamSpecBase, np.ndarray]:
+    ) -> tuple[ParamSpecBase, ...]:
         """
-        Unpack the `setpoints` and their values from a
-        :class:`ArrayParameter` or :class:`MultiParameter`
-        into a standard results dict form and return that dict
+        Look up the ParamSpecBases of the setpoints of an
+        :class:`ArrayParameter` or (part of a) :class:`MultiParameter`.
+        The result is cached by the setpoint names and the number of
+        setpoints, which does not keep the parameter itself alive.
         """
-        setpoint_axes = []
-        setpoint_parameters: list[ParamSpecBase] = []
+        key = (
+            fallback_sp_name,
+            tuple(sp_names) if sp_names is not None else None,
+            n_setpoints,
+        )
+        setpoint_parameters = self._setpoint_spec_cache.get(key)
+        if setpoint_parameters is not None:
+            return setpoint_parameters
 
-        for i, sps in enumerate(setpoints):
+        specs = []
+        for i in range(n_setpoints):
             if sp_names is not None:
                 spname = sp_names[i]
             else:
                 spname = f"{fallback_sp_name}_{i}"
 
             try:
-                setpoint_parameter = self._interdeps[spname]
+                specs.append(self._interdeps[spname])
             except KeyError:
                 raise RuntimeError(
                     "No setpoints registered for "
                     f"{type(parameter)} {parameter.full_name}!"
                 )
-            sps = np.array(sps)
+        setpoint_parameters = tuple(specs)
+        self._setpoint_spec_cache[key] = setpoint_parameters
+        return setpoint_parameters
+
+    def _unpack_setpoints_from_parameter(
+        self,
+        parameter: ParameterBase,
+        setpoints: Sequence[Any],
+        sp_names: Sequence[str] | None,
+        fallback_sp_name: str,
+    ) -> dict[ParamSpecBase, np.ndarray]:
+        """
+        Unpack the `setpoints` and their values from a
+        :class:`ArrayParameter` or :class:`MultiParameter`
+        into a standard results dict form and return that dict
+        """
+        setpoint_parameters = self._setpoint_paramspecs(
+            parameter, len(setpoints), sp_names, fallback_sp_name
+        )
+        setpoint_axes = []
+
+        for sps in setpoints:
+            # no copy is needed here since meshgrid copies the axes into
+            # the output grids
+            sps = np.asarray(sps)
             while sps.ndim > 1:
                 # The outermost setpoint axis or an nD param is nD
                 # but the innermost is 1D. In all cases we just need
                 # the axis along one dim, the innermost one.
                 sps = sps[0]
 
-            setpoint_parameters.append(setpoint_parameter)
             setpoint_axes.append(sps)
 
         output_grids = np.meshgrid(*setpoint_axes, indexing="ij")
@@ -440,7 +521,7 @@ class DataSaver:
             ) from err
 
     def _validate_result_shapes(
-        self, results_dict: Mapping[ParamSpecBase, values_type]
+        self, results_dict: Mapping[ParamSpecBase, np.ndarray]
     ) -> None:
         """
         Validate that all sizes of the ``results_dict`` are consistent.
@@ -448,14 +529,12 @@ class DataSaver:
         of the same size, whereas parameters with no setpoint relation to
         each other can have different sizes.
         """
-        toplevel_params = set(self._interdeps.dependencies).intersection(
-            set(results_dict)
-        )
+        toplevel_params = self._interdeps.dependencies.keys() & results_dict.keys()
         for toplevel_param in toplevel_params:
-            required_shape = np.shape(np.array(results_dict[toplevel_param]))
+            required_shape = results_dict[toplevel_param].shape
             for setpoint in self._interdeps.dependencies[toplevel_param]:
                 # a setpoint is allowed to be a scalar; shape is then ()
-                setpoint_shape = np.shape(np.array(results_dict[setpoint]))
+                setpoint_shape = results_dict[setpoint].shape
                 if setpoint_shape not in [(), required_shape]:
                     raise ValueError(
                         f"Incompatible shapes. Parameter "
@@ -473,15 +552,8 @@ class DataSaver:
         Validate the type of the results
         """
 
-        allowed_kinds = {
-            "numeric": "iuf",
-            "text": "SU",
-            "array": "iufcSUmM",
-            "complex": "c",
-        }
-
         for ps, values in results_dict.items():
-            if values.dtype.kind not in allowed_kinds[ps.type]:
+            if values.dtype.kind not in _ALLOWED_DTYPE_KINDS[ps.type]:
                 raise ValueError(
                     f"Parameter {ps.name} is of type "
                     f'"{ps.type}", but got a result of '
@@ -678,7 +750,7 @@ class Runner:
                 # We register with minimal waiting time.
                 # That should make all subscribers be called when data is flushed
                 # to the database
-                log.debug(f"Subscribing callable {callble} with state {state}")
+                log.debug("Subscribing callable %s with state %s", callble, state)
                 self.ds.subscribe(callble, min_wait=0, min_count=1, state=state)
         self._span.set_attributes(
             {
@@ -724,6 +796,7 @@ class Runner:
             context={"reason": "qcodes measurement exit", "qcodes_guid": self.ds.guid}
         ):
             self.datasaver.flush_data_to_database(block=True)
+            self.datasaver._clear_spec_caches()
 
             # perform the "teardown" events
             for func, args in self.exitactions:
@@ -804,7 +877,10 @@ class Measurement:
 
     @property
     def parameters(self) -> dict[str, ParamSpecBase]:
-        return deepcopy(self._interdeps._id_to_paramspec)
+        return {
+            name: copy(paramspec)
+            for name, paramspec in self._interdeps._id_to_paramspec.items()
+        }
 
     @property
     def write_period(self) -> float:
@@ -822,8 +898,8 @@ class Measurement:
     def _paramspecbase_from_strings(
         self,
         name: str,
-        setpoints: Sequence[str] | None = None,
-        basis: Sequence[str] | None = None,
+        setpoints: Iterable[str] | None = None,
+        basis: Iterable[str] | None = None,
     ) -> tuple[tuple[ParamSpecBase, ...], tuple[ParamSpecBase, ...]]:
         """
         Helper function to look up and get ParamSpecBases and to give a nice
@@ -843,7 +919,7 @@ class Measurement:
 
         # now handle setpoints
         depends_on = []
-        if setpoints:
+        if setpoints is not None:
             for sp in setpoints:
                 try:
                     sp_psb = idps._id_to_paramspec[sp]
@@ -856,7 +932,7 @@ class Measurement:
 
         # now handle inferred parameters
         inf_from = []
-        if basis:
+        if basis is not None:
             for inff in basis:
                 try:
                     inff_psb = idps._id_to_paramspec[inff]
@@ -1033,12 +1109,7 @@ class Measurement:
         Update the interdependencies object with a new group
         """
 
-        parameter: ParamSpecBase | None
-
-        try:
-            parameter = self._interdeps[name]
-        except KeyError:
-            parameter = None
+        parameter = self._interdeps._id_to_paramspec.get(name)
 
         paramspec = ParamSpecBase(
             name=name, paramtype=paramtype, label=label, unit=unit
@@ -1052,34 +1123,50 @@ class Measurement:
         if parameter is not None and parameter != paramspec:
             raise ValueError("Parameter already registered in this Measurement.")
 
-        if setpoints is not None:
-            sp_strings = [str_or_register_name(sp) for sp in setpoints]
-        else:
-            sp_strings = []
-
-        if basis is not None:
-            bs_strings = [str_or_register_name(bs) for bs in basis]
-        else:
-            bs_strings = []
+        sp_strings = (str_or_register_name(sp) for sp in setpoints or ())
+        bs_strings = (str_or_register_name(bs) for bs in basis or ())
 
         # get the ParamSpecBases
         depends_on, inf_from = self._paramspecbase_from_strings(
             name, sp_strings, bs_strings
         )
 
-        if depends_on:
+        # extend the interdependencies once since every extension rebuilds
+        # the whole object
+        if depends_on or inf_from:
             self._interdeps = self._interdeps.extend(
-                dependencies={paramspec: depends_on}
+                dependencies={paramspec: depends_on} if depends_on else None,
+                inferences={paramspec: inf_from} if inf_from else None,
             )
-        if inf_from:
-            self._interdeps = self._interdeps.extend(inferences={paramspec: inf_from})
-        if not (depends_on or inf_from):
+        else:
             self._interdeps = self._interdeps.extend(standalones=(paramspec,))
 
         log.info(f"Registered {name} in the Measurement.")
 
         return self
 
+    def _register_setpoint_specs(self, paramspecs: Sequence[ParamSpecBase]) -> None:
+        """
+        Register the setpoints of an array-valued parameter as standalone
+        parameters with a single extension of the interdependencies
+        """
+        new_specs: dict[str, ParamSpecBase] = {}
+        for paramspec in paramspecs:
+            registered = new_specs.get(
+                paramspec.name, self._interdeps._id_to_paramspec.get(paramspec.name)
+            )
+            if registered is not None and registered != paramspec:
+                raise ValueError("Parameter already registered in this Measurement.")
+            new_specs[paramspec.name] = paramspec
+
+        if not new_specs:
+            return
+
+        self._interdeps = self._interdeps.extend(standalones=tuple(new_specs.values()))
+
+        for name in new_specs:
+            log.info(f"Registered {name} in the Measurement.")
+
     def _register_arrayparameter(
         self,
         parameter: ArrayParameter,
@@ -1092,6 +1179,7 @@ class Measurement:
         ArrayParameter
         """
         my_setpoints = list(setpoints) if setpoints else []
+        sp_specs = []
         for i in range(len(parameter.shape)):
             if (
                 parameter.setpoint_full_names is not None
@@ -1109,16 +1197,15 @@ class Measurement:
             else:
                 spunit = ""
 
-            self._register_parameter(
-                name=spname,
-                paramtype=paramtype,
-                label=splabel,
-                unit=spunit,
-                setpoints=None,
-                basis=None,
+            sp_specs.append(
+                ParamSpecBase(
+                    name=spname, paramtype=paramtype, label=splabel, unit=spunit
+                )
             )
 
-            my_setpoints += [spname]
+            my_setpoints.append(spname)
+
+        self._register_setpoint_specs(sp_specs)
 
         self._register_parameter(
             parameter.register_name,
@@ -1141,6 +1228,7 @@ class Measurement:
         Parameter
         """
         my_setpoints = list(setpoints) if setpoints else []
+        sp_specs = []
         for sp in parameter.setpoints:
             if not isinstance(sp, Parameter):
                 raise RuntimeError(
@@ -1152,17 +1240,16 @@ class Measurement:
             splabel = sp.label
             spunit = sp.unit
 
-            self._register_parameter(
-                name=spname,
-                paramtype=paramtype,
-                label=splabel,
-                unit=spunit,
-                setpoints=None,
-                basis=None,
+            sp_specs.append(
+                ParamSpecBase(
+                    name=spname, paramtype=paramtype, label=splabel, unit=spunit
+                )
             )
 
             my_setpoints.append(spname)
 
+        self._register_setpoint_specs(sp_specs)
+
         self._register_parameter(
             parameter.register_name,
             parameter.label,
@@ -1184,6 +1271,10 @@ class Measurement:
         and register those as individual parameters
         """
         setpoints_lists = []
+        sp_specs = []
+        all_sp_names = multiparameter.setpoint_full_names
+        all_sp_labels = multiparameter.setpoint_labels
+        all_sp_units = multiparameter.setpoint_units
         for i in range(len(multiparameter.shapes)):
             shape = multiparameter.shapes[i]
             name = multiparameter.full_names[i]
@@ -1191,42 +1282,30 @@ class Measurement:
                 my_setpoints = setpoints
             else:
                 my_setpoints = list(setpoints) if setpoints else []
+                # look up the setpoint info of this component once rather
+                # than for every dimension
+                sp_names = all_sp_names[i] if all_sp_names is not None else None
+                sp_labels = all_sp_labels[i] if all_sp_labels is not None else None
+                sp_units = all_sp_units[i] if all_sp_units is not None else None
                 for j in range(len(shape)):
-                    if (
-                        multiparameter.setpoint_full_names is not None
-                        and multiparameter.setpoint_full_names[i] is not None
-                    ):
-                        spname = multiparameter.setpoint_full_names[i][j]
-                    else:
-                        spname = f"{name}_setpoint_{j}"
-                    if (
-                        multiparameter.setpoint_labels is not None
-                        and multiparameter.setpoint_labels[i] is not None
-                    ):
-                        splabel = multiparameter.setpoint_labels[i][j]
-                    else:
-                        splabel = ""
-                    if (
-                        multiparameter.setpoint_units is not None
-                        and multiparameter.setpoint_units[i] is not None
-                    ):
-                        spunit = multiparameter.setpoint_units[i][j]
-                    else:
-                        spunit = ""
-
-                    self._register_parameter(
-                        name=spname,
-                        paramtype=paramtype,
-                        label=splabel,
-                        unit=spunit,
-                        setpoints=None,
-                        basis=None,
+                    spname = (
+                        sp_names[j] if sp_names is not None else f"{name}_setpoint_{j}"
+                    )
+                    splabel = sp_labels[j] if sp_labels is not None else ""
+                    spunit = sp_units[j] if sp_units is not None else ""
+
+                    sp_specs.append(
+                        ParamSpecBase(
+                            name=spname, paramtype=paramtype, label=splabel, unit=spunit
+                        )
                     )
 
-                    my_setpoints += [spname]
+                    my_setpoints.append(spname)
 
             setpoints_lists.append(my_setpoints)
 
+        self._register_setpoint_specs(sp_specs)
+
         for i, expanded_setpoints in enumerate(setpoints_lists):
             self._register_parameter(
                 multiparameter.full_names[i],
@@ -1,6 +1,6 @@
 import re
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, Optional, Union
 
 import numpy as np
 from pyvisa import VisaIOError
@@ -29,14 +29,51 @@ if TYPE_CHECKING:
     from typing_extensions import Unpack
 
 
-class DSOTimeAxisParam(Parameter):
+# on/off mapping shared by the display parameters of all channels and functions
+_ON_OFF_INT_VAL_MAPPING = create_on_off_val_mapping(on_val=1, off_val=0)
+# validators are stateless, so a single instance is shared by all channels
+# and functions
+_INPUT_VALIDATOR = vals.Enum("DC", "DC50", "AC", "LFR1", "LFR2")
+_NUMBERS_VALIDATOR = vals.Numbers()
+_STRINGS_VALIDATOR = vals.Strings()
+
+
+class _WaveformPreamble(NamedTuple):
     """
-    Time axis parameter for the Infiniium series DSO.
+    Fields of a waveform preamble used by the driver.
+    """
+
+    points: int
+    xincrement: float
+    xorigin: float
+    yincrement: float
+    yoffset: float
+    unit: int
+
+
+def _interpret_preamble(preamble: str) -> _WaveformPreamble:
+    """
+    Extract the fields used by the driver from a raw ``:WAV:PRE?`` response.
+    """
+    fields = preamble.strip().split(",")
+    return _WaveformPreamble(
+        points=int(fields[2]),
+        xincrement=float(fields[4]),
+        xorigin=float(fields[5]),
+        yincrement=float(fields[7]),
+        yoffset=float(fields[8]),
+        unit=int(fields[21]),
+    )
+
+
+class _DSOAxisParam(Parameter):
+    """
+    Evenly spaced axis parameter for the Infiniium series DSO.
     """
 
     def __init__(self, xorigin: float, xincrement: float, points: int, **kwargs: Any):
         """
-        Initialize time axis. If values are unknown, they can be initialized to zero and
+        Initialize axis. If values are unknown, they can be initialized to zero and
         filled in later.
         """
         super().__init__(**kwargs)
@@ -44,45 +81,44 @@ class DSOTimeAxisParam(Parameter):
         self.xorigin = xorigin
         self.xincrement = xincrement
         self.points = points
+        self._cached_axis: tuple[tuple[int, float, float], np.ndarray] | None = None
 
     def get_raw(self) -> np.ndarray:
         """
-        Return the array corresponding to this time axis.
-        """
-        return np.linspace(
-            self.xorigin,
-            self.xorigin + self.points * self.xincrement,
-            self.points,
-            endpoint=False,
-        )
+        Return the array corresponding to this axis.
 
-
-class DSOFrequencyAxisParam(Parameter):
+        The array is reused as long as the axis is unchanged and is therefore
+        read-only.
+        """
+        key = (self.points, self.xorigin, self.xincrement)
+        if self._cached_axis is not None and self._cached_axis[0] == key:
+            return self._cached_axis[1]
+        axis = np.arange(self.points, dtype=np.float64)
+        axis *= self.xincrement
+        axis += self.xorigin
+        axis.setflags(write=False)
+        self._cached_axis = (key, axis)
+        return axis
+
+
+class DSOTimeAxisParam(_DSOAxisParam):
     """
-    Frequency axis parameter for the Infiniium series DSO.
+    Time axis parameter for the Infiniium series DSO.
+
+    The returned array is shared between calls for as long as the axis is
+    unchanged and is therefore read-only. In-place operations such as
+    ``axis *= 1e9`` raise a ``ValueError``; copy the array first to modify it.
     """
 
-    def __init__(self, xorigin: float, xincrement: float, points: int, **kwargs: Any):
-        """
-        Initialize frequency axis. If values are unknown, they can be initialized
-        to zero and filled in later.
-        """
-        super().__init__(**kwargs)
 
-        self.xorigin = xorigin
-        self.xincrement = xincrement
-        self.points = points
+class DSOFrequencyAxisParam(_DSOAxisParam):
+    """
+    Frequency axis parameter for the Infiniium series DSO.
 
-    def get_raw(self) -> np.ndarray:
-        """
-        Return the array corresponding to this time axis.
-        """
-        return np.linspace(
-            self.xorigin,
-            self.xorigin + self.points * self.xincrement,
-            self.points,
-            endpoint=False,
-        )
+    The returned array is shared between calls for as long as the axis is
+    unchanged and is therefore read-only. In-place operations such as
+    ``axis *= 1e9`` raise a ``ValueError``; copy the array first to modify it.
+    """
 
 
 class DSOTraceParam(ParameterWithSetpoints):
@@ -112,6 +148,9 @@ class DSOTraceParam(ParameterWithSetpoints):
         self._ch_valid = False
         super().__init__(name, instrument=instrument, **kwargs)
         self._channel = channel
+        # commands that select this trace as the source and query it
+        self._preamble_cmd = f":WAV:SOUR {channel};:WAV:PRE?"
+        self._data_cmd = f":WAV:SOUR {channel};:WAV:DATA?"
         # This parameter will be updated prior to being retrieved if
         # self.root_instrument.auto_digitize is true.
         self._points = 0
@@ -159,8 +198,7 @@ class DSOTraceParam(ParameterWithSetpoints):
         elif self._unit != 0:
             return self.UNIT_MAP[self._unit]
         elif self.instrument is not None:
-            self.instrument.write(f":WAV:SOUR {self._channel}")
-            return self.instrument.ask(":WAV:YUN?")
+            return self.instrument.ask(f":WAV:SOUR {self._channel};:WAV:YUN?")
         return "''"
 
     @unit.setter
@@ -178,28 +216,38 @@ class DSOTraceParam(ParameterWithSetpoints):
         instrument: KeysightInfiniiumChannel | KeysightInfiniiumFunction
         instrument = self.instrument  # type: ignore[assignment]
         if preamble is None:
-            instrument.write(f":WAV:SOUR {self._channel}")
-            preamble = instrument.ask(":WAV:PRE?").strip().split(",")
-        self._points = int(preamble[2])
-        self._yincrement = float(preamble[7])
-        self._yoffset = float(preamble[8])
-        self._unit = int(preamble[21])
-        instrument.time_axis.points = int(preamble[2])
-        instrument.time_axis.xorigin = float(preamble[5])
-        instrument.time_axis.xincrement = float(preamble[4])
-        self._ch_valid = True
+            raw_preamble = instrument.ask(self._preamble_cmd)
+        else:
+            raw_preamble = ",".join(preamble)
+        self._update_from_preamble(raw_preamble)
 
     def update_fft_setpoints(self) -> None:
         """
         Update waveform parameters for an FFT.
         """
         instrument: KeysightInfiniiumFunction = self.instrument  # type: ignore[assignment]
-        instrument.write(f":WAV:SOUR {self._channel}")
-        preamble = instrument.ask(":WAV:PRE?").strip().split(",")
-        self.update_setpoints(preamble)
-        instrument.frequency_axis.points = int(preamble[2])
-        instrument.frequency_axis.xorigin = float(preamble[5])
-        instrument.frequency_axis.xincrement = float(preamble[4])
+        header = self._update_from_preamble(instrument.ask(self._preamble_cmd))
+        instrument.frequency_axis.points = header.points
+        instrument.frequency_axis.xorigin = header.xorigin
+        instrument.frequency_axis.xincrement = header.xincrement
+
+    def _update_from_preamble(self, raw_preamble: str) -> _WaveformPreamble:
+        """
+        Update the scaling of this trace and its time axis from a raw
+        waveform preamble and return the interpreted preamble.
+        """
+        instrument: KeysightInfiniiumChannel | KeysightInfiniiumFunction
+        instrument = self.instrument  # type: ignore[assignment]
+        header = _interpret_preamble(raw_preamble)
+        self._points = header.points
+        self._yincrement = header.yincrement
+        self._yoffset = header.yoffset
+        self._unit = header.unit
+        instrument.time_axis.points = header.points
+        instrument.time_axis.xorigin = header.xorigin
+        instrument.time_axis.xincrement = header.xincrement
+        self._ch_valid = True
+        return header
 
     def get_raw(self) -> np.ndarray:
         """
@@ -221,22 +269,26 @@ class DSOTraceParam(ParameterWithSetpoints):
         # Check if we should run a new sweep
         if root_instr.auto_digitize():
             root_instr.digitize()
-        # Ask for waveform data
-        root_instr.write(f":WAV:SOUR {self._channel}")
-        root_instr.write(":WAV:DATA?")
+        datatype: Literal["b", "h"] = (
+            "b" if root_instr.waveform_format.cache() == "BYTE" else "h"
+        )
+        # Select the source and ask for waveform data in a single message
+        root_instr.write(self._data_cmd)
+        visa_handle = root_instr.visa_handle
         # Ignore first two bytes, which should be "#0"
-        _ = root_instr.visa_handle.read_bytes(2)
+        _ = visa_handle.read_bytes(2)
         data: np.ndarray
-        data = root_instr.visa_handle.read_binary_values(  # type: ignore[assignment]
-            "h",
+        data = visa_handle.read_binary_values(  # type: ignore[assignment]
+            datatype,
             container=np.ndarray,
             header_fmt="empty",
             expect_termination=True,
             data_points=self._points,
         )
-        data = data.astype(np.float64)
-        data = (data * self._yincrement) + self._yoffset
-        return data
+        # scale in place on a single float64 buffer
+        trace = np.multiply(data, self._yincrement, dtype=np.float64)
+        trace += self._yoffset
+        return trace
 
 
 class AbstractMeasurementSubsystem(InstrumentModule):
@@ -587,7 +639,7 @@ class KeysightInfiniiumFunction(InstrumentChannel):
             label=f"Function {channel} display on/off",
             set_cmd=f"FUNC{channel}:DISP {{}}",
             get_cmd=f"FUNC{channel}:DISP?",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
+            val_mapping=_ON_OFF_INT_VAL_MAPPING,
         )
 
         # Retrieve basic settings of the function
@@ -596,7 +648,7 @@ class KeysightInfiniiumFunction(InstrumentChannel):
             instrument=self,
             label=f"Function {channel} function",
             get_cmd=self._get_func,
-            vals=vals.Strings(),
+            vals=_STRINGS_VALIDATOR,
         )
         self.source: Parameter = Parameter(
             name="source",
@@ -717,7 +769,7 @@ class KeysightInfiniiumChannel(InstrumentChannel):
             label=f"Channel {channel} input coupling & impedance",
             set_cmd=f"CHAN{channel}:INP {{}}",
             get_cmd=f"CHAN{channel}:INP?",
-            vals=vals.Enum("DC", "DC50", "AC", "LFR1", "LFR2"),
+            vals=_INPUT_VALIDATOR,
         )
 
         # display
@@ -727,7 +779,7 @@ class KeysightInfiniiumChannel(InstrumentChannel):
             label=f"Channel {channel} display on/off",
             set_cmd=f"CHAN{channel}:DISP {{}}",
             get_cmd=f"CHAN{channel}:DISP?",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
+            val_mapping=_ON_OFF_INT_VAL_MAPPING,
         )
 
         # scaling
@@ -748,7 +800,7 @@ class KeysightInfiniiumChannel(InstrumentChannel):
             set_cmd=f"CHAN{channel}:RANG {{}}",
             get_cmd=f"CHAN{channel}:RANG?",
             get_parser=float,
-            vals=vals.Numbers(),
+            vals=_NUMBERS_VALIDATOR,
         )
 
         # Trigger level
@@ -760,7 +812,7 @@ class KeysightInfiniiumChannel(InstrumentChannel):
             set_cmd=f":TRIG:LEV CHAN{channel},{{}}",
             get_cmd=f":TRIG:LEV? CHAN{channel}",
             get_parser=float,
-            vals=vals.Numbers(),
+            vals=_NUMBERS_VALIDATOR,
         )
 
         # Trace data
@@ -859,8 +911,8 @@ class KeysightInfiniium(VisaInstrument):
         # switch the response header off else none of our parameters will work
         self.write(":SYSTem:HEADer OFF")
 
-        # Then set up the data format used to retrieve waveforms
-        self.write(":WAVEFORM:FORMAT WORD")
+        # Then set up the data format used to retrieve waveforms. The sample
+        # width is set by the waveform_format parameter below.
         self.write(":WAVEFORM:BYTEORDER LSBFirst")
         self.write(":WAVEFORM:STREAMING ON")
 
@@ -1036,6 +1088,24 @@ class KeysightInfiniium(VisaInstrument):
             vals=vals.Ints(min_value=1, max_value=10486575),
         )
 
+        # Data format used to transfer waveforms
+        self.waveform_format: Parameter = Parameter(
+            name="waveform_format",
+            instrument=self,
+            label="Waveform format",
+            get_cmd=":WAV:FORM?",
+            set_cmd=":WAV:FORM {}",
+            vals=vals.Enum("WORD", "BYTE"),
+            docstring=(
+                "Sample width used to transfer waveforms. WORD transfers 16 bit"
+                " samples. BYTE transfers 8 bit samples, which halves the"
+                " amount of data sent but limits the vertical resolution."
+                " Update the setpoints after changing this if cache_setpoints"
+                " is True, since the scaling in the preamble changes."
+            ),
+            initial_value="WORD",
+        )
+
         # Automatically digitize before acquiring a trace
         self.auto_digitize: Parameter = Parameter(
             name="auto_digitize",
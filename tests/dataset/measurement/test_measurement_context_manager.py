@@ -1033,6 +1033,40 @@ def test_datasaver_arrayparams(
     assert_allclose(data[spectrum_name], expected_output)
 
 
+@pytest.mark.usefixtures("experiment")
+def test_datasaver_arrayparam_with_changed_setpoint_names_raises(
+    SpectrumAnalyzer,
+) -> None:
+    """
+    Test that the setpoints of an array parameter are looked up again if
+    its setpoint names change during a measurement
+    """
+    spectrum = SpectrumAnalyzer.spectrum
+
+    meas = Measurement()
+    meas.register_parameter(spectrum)
+
+    with meas.run() as datasaver:
+        datasaver.add_result((spectrum, spectrum.get()))
+        spectrum.setpoint_names = ("Unregistered",)
+        with pytest.raises(RuntimeError, match="No setpoints registered"):
+            datasaver.add_result((spectrum, spectrum.get()))
+
+
+@pytest.mark.usefixtures("experiment")
+def test_datasaver_does_not_keep_parameters_after_run(DAC, DMM) -> None:
+    meas = Measurement()
+    meas.register_parameter(DAC.ch1)
+    meas.register_parameter(DMM.v1, setpoints=(DAC.ch1,))
+
+    with meas.run() as datasaver:
+        datasaver.add_result((DAC.ch1, 1), (DMM.v1, 2))
+        assert DAC.ch1 in datasaver._spec_cache
+
+    assert all(isinstance(key, str) for key in datasaver._spec_cache)
+    assert datasaver._setpoint_spec_cache == {}
+
+
 @settings(
     max_examples=5,
     deadline=None,
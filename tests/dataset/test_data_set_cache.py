@@ -10,6 +10,7 @@ from hypothesis import HealthCheck, given, settings
 
 from qcodes.dataset.descriptions.detect_shapes import detect_shape_of_measurement
 from qcodes.dataset.measurements import Measurement
+from qcodes.instrument_drivers.mock_instruments import Multi2DSetPointParam
 
 
 @pytest.mark.parametrize("bg_writing", [True, False])
@@ -1117,3 +1118,24 @@ def _prepare_setpoints_1d(DAC, channel_array_instrument, n_points, setpoints_typ
             j * (i + 1) for i, j in enumerate(ascii_uppercase * (n_points // 26 + 1))
         ][0:n_points]
     return setpoints_param, setpoints_values
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("storage_type", ["numeric", "array"])
+def test_cache_setpoints_of_2d_multiparam_are_writeable(storage_type) -> None:
+    param = Multi2DSetPointParam()
+    meas = Measurement()
+    meas.register_parameter(param, paramtype=storage_type)
+
+    with meas.run() as datasaver:
+        datasaver.add_result((param, param.get()))
+
+    data = datasaver.dataset.cache.data()
+    assert param.setpoint_full_names is not None
+    for name, setpoint_names in zip(param.full_names, param.setpoint_full_names):
+        for setpoint_name in setpoint_names:
+            setpoints = data[name][setpoint_name]
+            # the setpoints must not be views that share memory between
+            # elements, writing to those warns
+            assert 0 not in setpoints.strides
+            setpoints[...] = 0
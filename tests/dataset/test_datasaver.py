@@ -178,3 +178,78 @@ def test_duplicated_parameter_raises() -> None:
     finally:
         data_saver.dataset.mark_completed()
         data_saver.dataset.conn.close()  # type: ignore[attr-defined]
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("bg_writing", [True, False])
+def test_flush_in_chunks(bg_writing, monkeypatch, mocker) -> None:
+    """
+    Test that buffered results are all written when they are flushed in
+    several chunks
+    """
+    x = ParamSpecBase(name="x", paramtype="numeric")
+    y = ParamSpecBase(name="y", paramtype="numeric")
+    idps = InterDependencies_(dependencies={y: (x,)})
+
+    test_set = new_data_set("test-dataset")
+    test_set.prepare(snapshot={}, interdeps=idps, write_in_background=bg_writing)
+    monkeypatch.setattr(test_set, "flush_chunk_size", 3)
+    add_results_spy = mocker.spy(test_set, "add_results")
+
+    data_saver = DataSaver(dataset=test_set, write_period=1000, interdeps=idps)
+
+    xvals = np.arange(10)
+    data_saver.add_result(("x", xvals), ("y", 2 * xvals))
+    data_saver.flush_data_to_database(block=True)
+    test_set.mark_completed()
+
+    chunk_sizes = [len(call.args[0]) for call in add_results_spy.call_args_list]
+    assert chunk_sizes == [3, 3, 3, 1]
+
+    data = test_set.get_parameter_data("y")["y"]
+    np.testing.assert_array_equal(data["x"], xvals)
+    np.testing.assert_array_equal(data["y"], 2 * xvals)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_failed_flush_keeps_unwritten_chunks(monkeypatch) -> None:
+    """
+    Test that only the results that were not written are kept for the
+    next flush if writing a chunk fails
+    """
+    x = ParamSpecBase(name="x", paramtype="numeric")
+    y = ParamSpecBase(name="y", paramtype="numeric")
+    idps = InterDependencies_(dependencies={y: (x,)})
+
+    test_set = new_data_set("test-dataset")
+    test_set.prepare(snapshot={}, interdeps=idps, write_in_background=False)
+    monkeypatch.setattr(test_set, "flush_chunk_size", 3)
+
+    add_results = test_set.add_results
+    n_calls = 0
+
+    def fail_on_third_chunk(results):
+        nonlocal n_calls
+        n_calls += 1
+        if n_calls == 3:
+            raise RuntimeError("Failed to write chunk")
+        add_results(results)
+
+    monkeypatch.setattr(test_set, "add_results", fail_on_third_chunk)
+
+    data_saver = DataSaver(dataset=test_set, write_period=1000, interdeps=idps)
+
+    xvals = np.arange(10)
+    data_saver.add_result(("x", xvals), ("y", 2 * xvals))
+    data_saver.flush_data_to_database(block=True)
+
+    assert [row["x"] for row in test_set._results] == [6, 7, 8, 9]
+    assert test_set.number_of_results == 6
+
+    monkeypatch.undo()
+    data_saver.flush_data_to_database(block=True)
+    test_set.mark_completed()
+
+    data = test_set.get_parameter_data("y")["y"]
+    np.testing.assert_array_equal(data["x"], xvals)
+    np.testing.assert_array_equal(data["y"], 2 * xvals)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from qcodes.instrument_drivers.Keysight import KeysightInfiniium
+
+
+@pytest.fixture(scope="function", name="driver")
+def _make_driver():
+    driver = KeysightInfiniium(
+        "infiniium",
+        address="GPIB::1::INSTR",
+        # This matches the address in the .yaml file
+        pyvisa_sim_file="Keysight_Infiniium.yaml",
+    )
+    driver.auto_digitize(False)
+
+    yield driver
+    driver.close()
+
+
+def test_initialize(driver) -> None:
+    idn_dict = driver.IDN()
+    assert idn_dict["vendor"] == "QCoDeS"
+
+
+def test_waveform_format(driver) -> None:
+    assert driver.waveform_format() == "WORD"
+    driver.waveform_format("BYTE")
+    assert driver.waveform_format() == "BYTE"
+    with pytest.raises(ValueError):
+        driver.waveform_format("ASCII")
+
+
+@pytest.mark.parametrize(
+    "waveform_format, datatype, raw_dtype",
+    [("WORD", "h", np.int16), ("BYTE", "b", np.int8)],
+)
+def test_trace_datatype_follows_waveform_format(
+    driver, mocker, waveform_format, datatype, raw_dtype
+) -> None:
+    driver.waveform_format(waveform_format)
+    mocker.patch.object(driver.visa_handle, "read_bytes", return_value=b"#0")
+    read_binary_values = mocker.patch.object(
+        driver.visa_handle,
+        "read_binary_values",
+        return_value=np.array([-1, 0, 1], dtype=raw_dtype),
+    )
+
+    trace = driver.ch1.trace()
+
+    assert read_binary_values.call_args.args[0] == datatype
+    assert read_binary_values.call_args.kwargs["data_points"] == 3
+    assert trace.dtype == np.float64
+    np.testing.assert_allclose(trace, [0.098, 0.1, 0.102])
+    np.testing.assert_allclose(driver.ch1.time_axis(), [-1.5e-9, -0.5e-9, 0.5e-9])